@@ -1,3 +1,8 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import File
+
+
+@admin.register(File)
+class FileAdmin(admin.ModelAdmin):
+    list_display = ("name", "topic", "conflict_display", "created_at")
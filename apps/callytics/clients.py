@@ -7,16 +7,62 @@ apps/callytics/clients.py
 <설정 안내>
 - settings.py에 다음 값을 추가해주세요.
     CALLYTICS_URL = os.getenv("CALLYTICS_URL")  # 예: http://192.168.0.10:8000/predict
+  (HTTP/2 멀티플렉싱을 쓰려면 https:// 주소가 필요합니다)
 
 <사용 예시>
   from apps.callytics.clients import call_callytics
   result = call_callytics("/path/to/audio.wav", {"topic_name": "상담"})
 """
 
-import requests
+import json
+import os
+
+import httpx
+import orjson
+import pybreaker
 from django.conf import settings
 
 
+# Celery 워커는 오래 살아있는 프로세스이므로, 모듈 단위 클라이언트를 재사용하여
+# 매 호출마다 TCP/TLS 핸드셰이크를 다시 하지 않도록 커넥션을 유지합니다.
+# HTTP/2는 TLS(ALPN) 협상으로만 사용되므로 CALLYTICS_URL이 https://이고 서버가 h2를 지원할 때만
+# 하나의 커넥션에서 여러 요청을 동시에 주고받습니다. http:// 주소에서는 HTTP/1.1 keep-alive로 동작합니다.
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,  # 연결 실패 시 재시도
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    ),
+    timeout=httpx.Timeout(5.0, read=120.0),
+)
+
+
+class CallyticsServerError(Exception):
+    """
+    Callytics 서버가 5xx로 응답한 경우 (일시적 장애로 보고 재시도 대상)
+    """
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"Callytics server error {response.status_code}: {response.url}")
+        self.response = response
+
+
+def _is_client_error(exc: Exception) -> bool:
+    """
+    4xx 응답은 요청 자체의 문제이므로 서버 장애로 집계하지 않음
+    """
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.is_client_error
+
+
+# 모델 서버 장애 시 연속 5회 실패하면 30초 동안 호출을 즉시 차단(CircuitBreakerError)하여
+# 워커가 매 메시지마다 타임아웃(최대 120초)을 기다리지 않도록 합니다.
+_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=5,
+    reset_timeout=30,
+    exclude=[OSError, _is_client_error],
+)
+
+
+@_BREAKER
 def call_callytics(audio_path: str, metadata: dict) -> dict:
     """
     Callytics API에 오디오 파일과 메타데이터를 전송하여
@@ -25,16 +71,21 @@ def call_callytics(audio_path: str, metadata: dict) -> dict:
     :param audio_path: 분석할 오디오 파일의 파일 시스템 경로
     :param metadata:   모델에 전달할 메타데이터 딕셔너리
     :return:           API에서 반환한 JSON 결과
+    :raises CallyticsServerError:          5xx 응답
+    :raises httpx.HTTPStatusError:         4xx 응답 (재시도하지 않음)
+    :raises pybreaker.CircuitBreakerError: 최근 연속 실패로 호출이 차단된 경우
     """
     with open(audio_path, "rb") as f:
-        files = {"audio": f}
+        # httpx는 multipart 본문을 메모리에 한 번에 만들지 않고
+        # 파일을 청크 단위로 읽어 소켓으로 바로 스트리밍합니다.
         # metadata는 추후에 구조보고 결정해야할 듯
-        data = {"metadata": metadata}
-        resp = requests.post(
+        resp = _CLIENT.post(
             settings.CALLYTICS_URL,
-            files=files,
-            data=data,
-            timeout=120
+            files={"audio": (os.path.basename(audio_path), f, "audio/wav")},
+            data={"metadata": json.dumps(metadata)},
         )
+    if resp.is_server_error:
+        raise CallyticsServerError(resp)
     resp.raise_for_status()
-    return resp.json()
\ No newline at end of file
+    # 음향 특성 배열이 큰 응답이므로 표준 json 대신 orjson으로 파싱
+    return orjson.loads(resp.content)
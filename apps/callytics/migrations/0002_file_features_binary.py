@@ -0,0 +1,67 @@
+# Generated by Django 5.2.1 on 2026-10-15 09:00
+
+import numpy as np
+from django.db import migrations, models
+
+
+FEATURE_FIELDS = ("chroma_stft", "spec_contr", "tonnetz", "mfcc")
+
+
+def json_to_binary(apps, schema_editor):
+    File = apps.get_model("callytics", "File")
+    for file_obj in File.objects.only("id", *FEATURE_FIELDS).iterator():
+        for name in FEATURE_FIELDS:
+            setattr(file_obj, f"{name}_raw", np.asarray(getattr(file_obj, name), dtype=np.float16).tobytes())
+        file_obj.save(update_fields=[f"{name}_raw" for name in FEATURE_FIELDS])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='file',
+            name='chroma_stft_raw',
+            field=models.BinaryField(default=b'', verbose_name='크로마 STFT (12d per frame, float16)'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='spec_contr_raw',
+            field=models.BinaryField(default=b'', verbose_name='스펙트럴 대비 (7d per frame, float16)'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='tonnetz_raw',
+            field=models.BinaryField(default=b'', verbose_name='Tonnetz 특성 (6d per frame, float16)'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='mfcc_raw',
+            field=models.BinaryField(default=b'', verbose_name='MFCC 계수 0~13 (14d per frame, float16)'),
+            preserve_default=False,
+        ),
+        # 되돌릴 때 다시 추가되는 JSON 필드는 기본값이 없는 NOT NULL 컬럼이라 데이터를 복원할 수 없으므로 역방향 작업을 두지 않습니다.
+        migrations.RunPython(json_to_binary),
+        migrations.RemoveField(
+            model_name='file',
+            name='chroma_stft',
+        ),
+        migrations.RemoveField(
+            model_name='file',
+            name='spec_contr',
+        ),
+        migrations.RemoveField(
+            model_name='file',
+            name='tonnetz',
+        ),
+        migrations.RemoveField(
+            model_name='file',
+            name='mfcc',
+        ),
+    ]
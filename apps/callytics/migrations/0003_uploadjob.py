@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-15 09:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0002_file_features_binary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('audio_path', models.TextField(verbose_name='오디오 파일 경로')),
+                ('user_id', models.IntegerField(verbose_name='상담사 ID')),
+                ('gender', models.CharField(max_length=10, verbose_name='성별')),
+                ('age', models.IntegerField(verbose_name='나이')),
+                ('topic_name', models.CharField(blank=True, max_length=100, null=True, verbose_name='토픽 이름')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '처리 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='작업 상태')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='요청 시각')),
+                ('file', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='callytics.file', verbose_name='분석 결과 파일')),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-15 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0003_uploadjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='file',
+            name='audio_sha256',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True, verbose_name='오디오 SHA-256'),
+        ),
+        migrations.AddField(
+            model_name='uploadjob',
+            name='audio_sha256',
+            field=models.CharField(default='', max_length=64, verbose_name='오디오 SHA-256'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-15 09:30
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_file_rate(apps, schema_editor):
+    File = apps.get_model("callytics", "File")
+    Utterance = apps.get_model("callytics", "Utterance")
+    Utterance.objects.update(
+        rate=Subquery(File.objects.filter(pk=OuterRef("file_id")).values("rate")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0004_audio_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='utterance',
+            name='rate',
+            field=models.IntegerField(default=0, verbose_name='샘플링 레이트 (Hz)'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_file_rate, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='file',
+            name='duration_seconds',
+            field=models.GeneratedField(db_persist=True, expression=models.F('duration') * models.Value(512.0) / models.F('rate'), output_field=models.FloatField(), verbose_name='전체 길이 (초)'),
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='silence_seconds',
+            field=models.GeneratedField(db_persist=True, expression=models.F('silence') * models.Value(512.0) / models.F('rate'), output_field=models.FloatField(), verbose_name='침묵 길이 (초)'),
+        ),
+        migrations.AddField(
+            model_name='utterance',
+            name='duration_seconds',
+            field=models.GeneratedField(db_persist=True, expression=(models.F('end_time') - models.F('start_time')) * models.Value(512.0) / models.F('rate'), output_field=models.FloatField(), verbose_name='발화 길이 (초)'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-15 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0005_seconds_generated_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadjob',
+            name='tmp_path',
+            field=models.TextField(blank=True, default='', verbose_name='임시 파일 경로'),
+        ),
+        migrations.AddField(
+            model_name='uploadjob',
+            name='target_name',
+            field=models.CharField(blank=True, default='', max_length=200, verbose_name='저장 파일 이름'),
+        ),
+        migrations.AlterField(
+            model_name='uploadjob',
+            name='audio_path',
+            field=models.TextField(blank=True, verbose_name='오디오 파일 경로'),
+        ),
+    ]
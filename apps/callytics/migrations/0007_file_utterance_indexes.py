@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-15 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0006_uploadjob_tmp_path'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['topic', '-created_at'], name='file_topic_recent_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='utterance',
+            constraint=models.UniqueConstraint(fields=('file', 'sequence'), name='uniq_file_seq'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-15 10:10
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_file_name(apps, schema_editor):
+    File = apps.get_model("callytics", "File")
+    Utterance = apps.get_model("callytics", "Utterance")
+    Utterance.objects.update(
+        file_name=Subquery(File.objects.filter(pk=OuterRef("file_id")).values("name")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0008_alter_file_conflict'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='utterance',
+            name='file_name',
+            field=models.CharField(default='', max_length=200, verbose_name='파일 이름'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_file_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-15 10:30
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_topics(apps, schema_editor):
+    Topic = apps.get_model("callytics", "Topic")
+    File = apps.get_model("callytics", "File")
+    duplicates = (
+        Topic.objects.values("name")
+        .annotate(c=Count("id"), keep_id=Min("id"))
+        .filter(c__gt=1)
+    )
+    for row in duplicates:
+        others = Topic.objects.filter(name=row["name"]).exclude(id=row["keep_id"])
+        File.objects.filter(topic__in=others).update(topic_id=row["keep_id"])
+        others.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0009_utterance_file_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_topics, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='topic',
+            name='name',
+            field=models.CharField(max_length=100, unique=True, verbose_name='토픽 이름'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.1 on 2026-10-15 10:50
+
+import django.db.models.deletion
+from django.db import NotSupportedError, migrations, models
+
+
+def _recreate_file_fk(schema_editor, on_delete_sql):
+    """
+    callytics_utterance.file_id 외래키 제약을 지정한 ON DELETE 동작으로 다시 생성
+    ALTER TABLE ... ADD CONSTRAINT를 지원하는 MySQL, PostgreSQL에서만 실행합니다.
+    (MySQL에서는 외래키 추가 시 callytics_utterance 테이블이 다시 만들어집니다.)
+    제약 SQL은 백엔드의 sql_create_fk로 만들어 PostgreSQL의 DEFERRABLE INITIALLY DEFERRED를 유지합니다.
+    SQLite는 0012에서 테이블이 다시 만들어지므로 0013 마이그레이션에서 처리합니다.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        return
+    if connection.vendor not in ("mysql", "postgresql"):
+        # 제약 없이 진행하면 File 삭제가 외래키 오류로 실패하므로 마이그레이션을 중단합니다.
+        raise NotSupportedError(
+            "callytics_utterance.file_id의 ON DELETE CASCADE는 %s에서 지원하지 않습니다." % connection.vendor
+        )
+    table = "callytics_utterance"
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    names = [
+        name for name, info in constraints.items()
+        if info["foreign_key"] and info["columns"] == ["file_id"]
+    ]
+    for name in names:
+        schema_editor.execute(schema_editor.sql_delete_fk % {
+            "table": schema_editor.quote_name(table),
+            "name": schema_editor.quote_name(name),
+        })
+    name = names[0] if names else "callytics_utterance_file_id_fk_callytics_file_id"
+    # ON DELETE 절은 DEFERRABLE 절보다 앞에 와야 하므로 deferrable 자리에 함께 넣습니다.
+    schema_editor.execute(schema_editor.sql_create_fk % {
+        "table": schema_editor.quote_name(table),
+        "name": schema_editor.quote_name(name),
+        "column": schema_editor.quote_name("file_id"),
+        "to_table": schema_editor.quote_name("callytics_file"),
+        "to_column": schema_editor.quote_name("id"),
+        "deferrable": on_delete_sql + connection.ops.deferrable_sql(),
+    })
+
+
+def add_on_delete_cascade(apps, schema_editor):
+    _recreate_file_fk(schema_editor, " ON DELETE CASCADE")
+
+
+def remove_on_delete_cascade(apps, schema_editor):
+    _recreate_file_fk(schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0010_topic_name_unique'),
+    ]
+
+    # Utterance.file은 DO_NOTHING이므로 File(및 Topic) 삭제 시 발화 삭제는 여기서 추가하는 ON DELETE CASCADE에만 의존합니다.
+    # 이후 Utterance.file을 AlterField하면 Django가 외래키를 다시 만들며 ON DELETE CASCADE가 조용히 사라지므로
+    # 같은 마이그레이션에서 이 RunPython을 다시 실행해야 합니다.
+    operations = [
+        migrations.AlterField(
+            model_name='utterance',
+            name='file',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='callytics.file', verbose_name='관련 파일'),
+        ),
+        migrations.RunPython(add_on_delete_cascade, remove_on_delete_cascade),
+    ]
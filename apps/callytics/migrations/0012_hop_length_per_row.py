@@ -0,0 +1,55 @@
+# Generated by Django 5.2.1 on 2026-10-16 09:00
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0011_utterance_file_db_cascade'),
+    ]
+
+    # 생성 컬럼 식은 변경(AlterField)할 수 없으므로 삭제 후 다시 추가합니다.
+    # 기존 행은 0005 마이그레이션이 사용한 hop length 512로 채웁니다.
+    operations = [
+        migrations.RemoveField(
+            model_name='file',
+            name='duration_seconds',
+        ),
+        migrations.RemoveField(
+            model_name='file',
+            name='silence_seconds',
+        ),
+        migrations.RemoveField(
+            model_name='utterance',
+            name='duration_seconds',
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='hop_length',
+            field=models.IntegerField(default=512, verbose_name='hop length'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='utterance',
+            name='hop_length',
+            field=models.IntegerField(default=512, verbose_name='hop length'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='duration_seconds',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(models.F('duration') * models.F('hop_length'), models.FloatField()) / models.F('rate'), output_field=models.FloatField(), verbose_name='전체 길이 (초)'),
+        ),
+        migrations.AddField(
+            model_name='file',
+            name='silence_seconds',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(models.F('silence') * models.F('hop_length'), models.FloatField()) / models.F('rate'), output_field=models.FloatField(), verbose_name='침묵 길이 (초)'),
+        ),
+        migrations.AddField(
+            model_name='utterance',
+            name='duration_seconds',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast((models.F('end_time') - models.F('start_time')) * models.F('hop_length'), models.FloatField()) / models.F('rate'), output_field=models.FloatField(), verbose_name='발화 길이 (초)'),
+        ),
+    ]
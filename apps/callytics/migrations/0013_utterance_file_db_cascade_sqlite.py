@@ -0,0 +1,42 @@
+# Generated by Django 5.2.1 on 2026-10-17 09:00
+
+from django.db import migrations
+
+SQLITE_INLINE_FK = "REFERENCES %%(to_table)s (%%(to_column)s)%s DEFERRABLE INITIALLY DEFERRED"
+
+
+def _remake_utterance_table(apps, schema_editor, on_delete_sql):
+    """
+    SQLite에서 callytics_utterance 테이블을 다시 만들어 file_id 외래키의 ON DELETE 동작을 지정
+    SQLite는 기존 외래키 제약을 변경할 수 없으므로 Django가 AlterField에 쓰는 테이블 재생성을 그대로 이용합니다.
+    """
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    Utterance = apps.get_model("callytics", "Utterance")
+    inline_fk = schema_editor.sql_create_inline_fk
+    schema_editor.sql_create_inline_fk = SQLITE_INLINE_FK % on_delete_sql
+    try:
+        schema_editor._remake_table(Utterance)
+    finally:
+        schema_editor.sql_create_inline_fk = inline_fk
+
+
+def add_on_delete_cascade(apps, schema_editor):
+    _remake_utterance_table(apps, schema_editor, " ON DELETE CASCADE")
+
+
+def remove_on_delete_cascade(apps, schema_editor):
+    _remake_utterance_table(apps, schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('callytics', '0012_hop_length_per_row'),
+    ]
+
+    # MySQL, PostgreSQL은 0011에서 처리했습니다. SQLite는 테이블을 다시 만드는 모든 작업(0012의 AddField 등)에서
+    # ON DELETE CASCADE가 사라지므로, 이후 callytics_utterance를 바꾸는 마이그레이션 뒤에도 이 작업을 다시 실행해야 합니다.
+    operations = [
+        migrations.RunPython(add_on_delete_cascade, remove_on_delete_cascade),
+    ]
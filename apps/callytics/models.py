@@ -2,12 +2,14 @@
 apps/callytics/models.py
 
 이 파일은 Callytics 모델 분석 결과를 저장하기 위한 Django 모델 정의입니다.
-각 클래스와 필드에 대한 상세 설명과, 프레임(frame) 단위 데이터를 초(second)로 변환하는 유틸 프로퍼티를 포함합니다.
+각 클래스와 필드에 대한 상세 설명과, 프레임(frame) 단위 데이터를 초(second)로 변환해 DB에 저장하는 생성 컬럼을 포함합니다.
 
 <설정 안내>
 - settings.py에 다음 값을 추가해주세요.
     HOP_LENGTH = 512   # 분석 시 프레임 간 hop length
     # 샘플링 레이트(sr)는 분석 시 입력된 audio 파일의 rate 필드를 사용합니다.
+    # HOP_LENGTH는 분석 시점의 값이 File/Utterance의 hop_length 컬럼에 행마다 저장되고,
+    # 초 단위 생성 컬럼은 이 컬럼으로 계산되므로 값을 바꿔도 마이그레이션이 필요 없습니다.
 
 < 마이그레이션 안내 >
 1) 모델 변경사항 반영 파일 생성할 때에는
@@ -16,26 +18,57 @@ apps/callytics/models.py
    $ python manage.py migrate
 
 다른 파일에 사용 예시
-  from apps.callytics.models import File, Utterance, Topic
+  from apps.callytics.models import File, Utterance, Topic, UploadJob
   # API로부터 받은 JSON을 이 모델에 매핑해 저장할 수 있습니다.
 """
 
+import numpy as np
 from django.db import models
-from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Cast
+
+
+# 프레임별 음향 특성 배열은 JSON 대신 float16 바이너리로 압축 저장합니다.
+# FEATURE_DIMS: 특성 이름 → 프레임당 차원 수
+FEATURE_DTYPE = np.float16
+FEATURE_DIMS = {
+    "chroma_stft": 12,
+    "spec_contr":  7,
+    "tonnetz":     6,
+    "mfcc":        14,
+}
+
+# 갈등 플래그 표시용 라벨 (BooleanField에 choices를 두지 않고 표시할 때만 사용)
+CONFLICT_LABELS = {False: "없음", True: "있음"}
+
+
+def unpack_features(raw, dim: int) -> np.ndarray:
+    """
+    FEATURE_DTYPE 배열의 tobytes()로 저장된 바이트열을 (프레임 수, dim) 배열로 복원
+    """
+    return np.frombuffer(raw, dtype=FEATURE_DTYPE).reshape(-1, dim)
 
 
 class Topic(models.Model):
     """
     대화 토픽 정보를 저장하는 테이블
     - Django는 각 모델에 기본 키(primary key)로 id라는 AutoField를 자동 추가하기 때문에 id는 명시하지 않습니다.
-    - name: 토픽 이름 (예를 들어 '상품 문의', '결제 문제' 등)
+    - name: 토픽 이름 (예를 들어 '상품 문의', '결제 문제' 등), 중복 불가
     """
-    name = models.CharField(max_length=100, verbose_name="토픽 이름")
+    name = models.CharField(max_length=100, unique=True, verbose_name="토픽 이름")
 
     def __str__(self):
         return self.name
 
 
+class FileManager(models.Manager):
+    """
+    File 조회 시 __str__에서 참조하는 topic을 함께 JOIN으로 가져오는 기본 매니저
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related("topic")
+
+
 class File(models.Model):
     """
     업로드된 상담 오디오 파일의 분석 결과를 저장하는 테이블
@@ -53,15 +86,19 @@ class File(models.Model):
       - spec_bw     : 스펙트럼 분산도 지표
       - spec_flat   : 톤성 vs 잡음성 비율 지표
       - rolloff     : 스펙트럼 누적 에너지의 경계 주파수
-      - chroma_stft : 12개 음계별 에너지 강도
-      - spec_contr  : 주파수 대역 간 강도 대비
-      - tonnetz     : 조화적 관계 측정 지표
-      - mfcc        : MFCC 계수 0~13
+      - chroma_stft : 12개 음계별 에너지 강도 (chroma_stft_raw에 float16 바이너리로 저장)
+      - spec_contr  : 주파수 대역 간 강도 대비 (spec_contr_raw에 float16 바이너리로 저장)
+      - tonnetz     : 조화적 관계 측정 지표 (tonnetz_raw에 float16 바이너리로 저장)
+      - mfcc        : MFCC 계수 0~13 (mfcc_raw에 float16 바이너리로 저장)
       - summary     : LLM이 생성한 통화 요약 텍스트
       - conflict    : 갈등 플래그(True=갈등 있음)
       - silence     : 침묵 구간 총 프레임 수
       - created_at  : 분석 시각
-    프레임 단위 수치는 duration_seconds, silence_seconds 프로퍼티로 초 단위 변환 가능
+      - audio_sha256: 오디오 파일 SHA-256 해시(동일 파일 재분석 방지용)
+      - hop_length  : 분석 시 사용한 프레임 간 hop length (settings.HOP_LENGTH)
+    프레임 단위 수치는 DB가 계산해 저장하는 duration_seconds, silence_seconds 컬럼으로 초 단위 조회·필터링 가능
+    (생성 컬럼이므로 save() 직후에는 refresh_from_db()로 다시 읽어야 값이 채워집니다)
+    음향 특성 배열은 chroma_stft, spec_contr, tonnetz, mfcc 프로퍼티로 numpy 배열 조회 가능
     """
     name        = models.CharField(max_length=200, verbose_name="파일 이름")
     topic       = models.ForeignKey(Topic, on_delete=models.CASCADE, verbose_name="관련 토픽")
@@ -79,37 +116,96 @@ class File(models.Model):
     spec_bw     = models.BigIntegerField(verbose_name="스펙트럼 대역폭 프레임 수")
     spec_flat   = models.BigIntegerField(verbose_name="스펙트럼 평탄도 프레임 수")
     rolloff     = models.BigIntegerField(verbose_name="롤-오프 프레임 수")
-    chroma_stft = models.JSONField(verbose_name="크로마 STFT (12d per frame)")
-    spec_contr  = models.JSONField(verbose_name="스펙트럴 대비")
-    tonnetz     = models.JSONField(verbose_name="Tonnetz 특성")
-    mfcc        = models.JSONField(verbose_name="MFCC 계수 0~13")
+    chroma_stft_raw = models.BinaryField(verbose_name="크로마 STFT (12d per frame, float16)")
+    spec_contr_raw  = models.BinaryField(verbose_name="스펙트럴 대비 (7d per frame, float16)")
+    tonnetz_raw     = models.BinaryField(verbose_name="Tonnetz 특성 (6d per frame, float16)")
+    mfcc_raw        = models.BinaryField(verbose_name="MFCC 계수 0~13 (14d per frame, float16)")
     summary     = models.TextField(null=True, blank=True, verbose_name="통화 요약 텍스트")
-    conflict    = models.BooleanField(default=False, verbose_name="갈등 플래그", choices=[(False, "없음"), (True, "있음")])
+    conflict    = models.BooleanField(default=False, verbose_name="갈등 플래그")
     silence     = models.BigIntegerField(verbose_name="침묵 프레임 수")
     created_at  = models.DateTimeField(auto_now_add=True, verbose_name="분석 시각")
+    audio_sha256 = models.CharField(max_length=64, unique=True, null=True, blank=True, verbose_name="오디오 SHA-256")
+    hop_length  = models.IntegerField(verbose_name="hop length")
+
+    # 계산: frames * hop_length / sampling_rate (정수 나눗셈이 되지 않도록 실수로 변환)
+    duration_seconds = models.GeneratedField(
+        expression=Cast(F("duration") * F("hop_length"), models.FloatField()) / F("rate"),
+        output_field=models.FloatField(),
+        db_persist=True,
+        verbose_name="전체 길이 (초)",
+    )
+    silence_seconds = models.GeneratedField(
+        expression=Cast(F("silence") * F("hop_length"), models.FloatField()) / F("rate"),
+        output_field=models.FloatField(),
+        db_persist=True,
+        verbose_name="침묵 길이 (초)",
+    )
+
+    objects = FileManager()
+
+    class Meta:
+        indexes = [
+            # 토픽별 최근 분석 목록 조회용
+            models.Index(fields=["topic", "-created_at"], name="file_topic_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.topic})"
 
+    def conflict_display(self) -> str:
+        """
+        갈등 플래그 표시 라벨('없음'/'있음')
+        """
+        return CONFLICT_LABELS[self.conflict]
+    conflict_display.short_description = "갈등 플래그"
+
+    def stream_utterances(self, chunk_size: int = 500):
+        """
+        이 파일의 발화를 순번 순서로 chunk_size개씩 나눠 읽어오는 제너레이터
+        (file, sequence) 인덱스로 마지막 순번 다음부터 조회하는 keyset 페이징을 사용하므로,
+        결과를 한 번에 메모리로 읽어오는 MySQL에서도 메모리에는 chunk_size개만 올라갑니다.
+        """
+        queryset = (
+            self.utterance_set
+            .order_by("sequence")
+            .only("sequence", "speaker", "start_time", "end_time", "content", "sentiment")
+        )
+        last_sequence = None
+        while True:
+            page = queryset if last_sequence is None else queryset.filter(sequence__gt=last_sequence)
+            batch = list(page[:chunk_size])
+            yield from batch
+            if len(batch) < chunk_size:
+                return
+            last_sequence = batch[-1].sequence
+
+    @property
+    def chroma_stft(self) -> np.ndarray:
+        """
+        크로마 STFT 배열 (프레임 수, 12)
+        """
+        return unpack_features(self.chroma_stft_raw, FEATURE_DIMS["chroma_stft"])
+
+    @property
+    def spec_contr(self) -> np.ndarray:
+        """
+        스펙트럴 대비 배열 (프레임 수, 7)
+        """
+        return unpack_features(self.spec_contr_raw, FEATURE_DIMS["spec_contr"])
+
     @property
-    def duration_seconds(self) -> float:
+    def tonnetz(self) -> np.ndarray:
         """
-        전체 프레임(duration)을 초 단위로 변환
-        계산: duration_frames * hop_length / sampling_rate
-        hop_length: settings.HOP_LENGTH (기본 512)
+        Tonnetz 특성 배열 (프레임 수, 6)
         """
-        hop_length = getattr(settings, "HOP_LENGTH", 512)
-        sr = self.rate
-        return self.duration * hop_length / sr
+        return unpack_features(self.tonnetz_raw, FEATURE_DIMS["tonnetz"])
 
     @property
-    def silence_seconds(self) -> float:
+    def mfcc(self) -> np.ndarray:
         """
-        침묵 프레임(silence)을 초 단위로 변환
+        MFCC 계수 배열 (프레임 수, 14)
         """
-        hop_length = getattr(settings, "HOP_LENGTH", 512)
-        sr = self.rate
-        return self.silence * hop_length / sr
+        return unpack_features(self.mfcc_raw, FEATURE_DIMS["mfcc"])
 
 
 class Utterance(models.Model):
@@ -124,9 +220,15 @@ class Utterance(models.Model):
       - content    : 발화 내용 텍스트
       - sentiment  : 감정 레이블
       - profane    : 비속어 사용 여부 플래그
-    duration_seconds 프로퍼티로 발화 길이 초 단위 확인 가능
+      - rate       : File.rate 복사본 (생성 컬럼은 외래키를 넘어 참조할 수 없어 비정규화)
+      - hop_length : File.hop_length 복사본 (같은 이유로 비정규화)
+      - file_name  : File.name 복사본 (__str__에서 File 조회 없이 사용)
+    DB가 계산해 저장하는 duration_seconds 컬럼으로 발화 길이 초 단위 확인 가능
     """
-    file       = models.ForeignKey(File, on_delete=models.CASCADE, verbose_name="관련 파일")
+    # Django가 발화 행을 모두 읽어와 개별 삭제하지 않도록 DO_NOTHING으로 두고, File(및 Topic) 삭제 시 발화 삭제는
+    # 마이그레이션으로 추가한 DB의 ON DELETE CASCADE 제약(0011: MySQL/PostgreSQL, 0013: SQLite)에만 의존합니다.
+    # 이 필드를 AlterField하면(SQLite는 테이블을 다시 만드는 모든 변경) 제약이 조용히 사라지므로 같은 작업을 다시 추가해야 합니다.
+    file       = models.ForeignKey(File, on_delete=models.DO_NOTHING, verbose_name="관련 파일")
     speaker    = models.CharField(max_length=10, choices=[("agent", "agent"), ("customer", "customer")], verbose_name="발화자")
     sequence   = models.IntegerField(verbose_name="발화 순번")
     start_time = models.BigIntegerField(verbose_name="시작 프레임 번호")
@@ -134,15 +236,77 @@ class Utterance(models.Model):
     content    = models.TextField(verbose_name="발화 내용")
     sentiment  = models.CharField(max_length=10, verbose_name="감정 레이블")
     profane    = models.BooleanField(default=False, verbose_name="비속어 플래그")
+    rate       = models.IntegerField(verbose_name="샘플링 레이트 (Hz)")
+    file_name  = models.CharField(max_length=200, verbose_name="파일 이름")
+    hop_length = models.IntegerField(verbose_name="hop length")
+    duration_seconds = models.GeneratedField(
+        expression=Cast((F("end_time") - F("start_time")) * F("hop_length"), models.FloatField()) / F("rate"),
+        output_field=models.FloatField(),
+        db_persist=True,
+        verbose_name="발화 길이 (초)",
+    )
+
+    class Meta:
+        constraints = [
+            # 파일 내 발화 순번 중복 방지 + (file, sequence) 순서 조회용 인덱스 역할
+            models.UniqueConstraint(fields=["file", "sequence"], name="uniq_file_seq"),
+        ]
+
+    def __str__(self):
+        return f"Utterance {self.sequence} of File {self.file_name}"
+
+
+class UploadJob(models.Model):
+    """
+    업로드 요청 단위의 파이프라인 작업 정보 저장
+    Celery 메시지에는 이 테이블의 id만 전달하고, 태스크가 행을 읽어 파라미터를 복원합니다.
+    컬럼 설명
+      - audio_path : 저장된 오디오 파일 경로 (태스크가 스토리지에 저장한 뒤 채워짐)
+      - tmp_path   : 업로드 요청 시 기록한 임시 파일 경로 (스토리지 저장 후 비움)
+      - target_name: 스토리지에 저장할 파일 이름 (uploads/UUID.ext)
+      - user_id    : 상담사 ID
+      - gender     : 상담사 성별
+      - age        : 상담사 나이
+      - topic_name : 토픽 이름(없으면 Callytics 결과의 topic 사용)
+      - audio_sha256 : 오디오 파일 SHA-256 해시
+      - status     : 작업 상태(pending/processing/done/failed)
+      - file       : 분석 완료 후 생성된 File 외래키
+      - created_at : 요청 시각
+    """
+    STATUS_PENDING    = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_DONE       = "done"
+    STATUS_FAILED     = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_PROCESSING, "처리 중"),
+        (STATUS_DONE, "완료"),
+        (STATUS_FAILED, "실패"),
+    ]
+
+    audio_path = models.TextField(blank=True, verbose_name="오디오 파일 경로")
+    tmp_path   = models.TextField(blank=True, default="", verbose_name="임시 파일 경로")
+    target_name = models.CharField(max_length=200, blank=True, default="", verbose_name="저장 파일 이름")
+    user_id    = models.IntegerField(verbose_name="상담사 ID")
+    gender     = models.CharField(max_length=10, verbose_name="성별")
+    age        = models.IntegerField(verbose_name="나이")
+    topic_name = models.CharField(max_length=100, null=True, blank=True, verbose_name="토픽 이름")
+    audio_sha256 = models.CharField(max_length=64, verbose_name="오디오 SHA-256")
+    status     = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="작업 상태")
+    file       = models.ForeignKey(File, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="분석 결과 파일")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="요청 시각")
 
     def __str__(self):
-        return f"Utterance {self.file} of File {self.file.name})"
+        return f"UploadJob {self.pk} ({self.status})"
 
     @property
-    def duration_seconds(self) -> float:
+    def metadata(self) -> dict:
         """
-        발화 길이(frame 수)를 초 단위로 변환
+        Callytics API에 전달할 메타데이터 딕셔너리
         """
-        hop_length = getattr(settings, "HOP_LENGTH", 512)
-        sr = self.file.rate
-        return (self.end_time - self.start_time) * hop_length / sr
+        return {
+            "user_id":    self.user_id,
+            "gender":     self.gender,
+            "age":        self.age,
+            "topic_name": self.topic_name,
+        }
@@ -5,6 +5,7 @@ apps/callytics/tasks.py
 
 <설정 안내>
 - config/celery.py에 Celery 앱이 설정되어 있어야 하며, django_celery_results를 INSTALLED_APPS에 추가해주세요.
+- 이 태스크는 config/celery.py의 task_routes에 따라 callytics_gpu 큐로 전달되므로 GPU 호스트에서 -Q callytics_gpu 워커를 실행해주세요.
 
 <마이그레이션 안내>
 - File, Utterance, Topic 모델이 정의된 후
@@ -12,66 +13,196 @@ apps/callytics/tasks.py
   python manage.py migrate
 
 <사용 예시>
+  from apps.callytics.models import UploadJob
   from apps.callytics.tasks import run_callytics_pipeline
-  run_callytics_pipeline.delay("/path/to/audio.wav", {"topic_name": "상담"})
+  job = UploadJob.objects.create(tmp_path="/tmp/upload.wav", target_name="uploads/audio.wav", user_id=1, gender="male", age=30, topic_name="상담")
+  run_callytics_pipeline.delay(job.pk)
 """
+import os
+
+import httpx
+import numpy as np
 from celery import shared_task
-from .clients import call_callytics
-from .models import Topic, File, Utterance
+from pybreaker import CircuitBreakerError
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from .clients import CallyticsServerError, call_callytics
+from .models import FEATURE_DIMS, FEATURE_DTYPE, Topic, File, Utterance, UploadJob
+
+
+def _insert_utterances(file_obj: File, rows: list) -> None:
+    """
+    Callytics 결과의 발화 목록을 bulk_create로 batch_size개씩 다중 행 INSERT
+    rate, hop_length, file_name은 File 값을 복사해 저장합니다.
+    """
+    Utterance.objects.bulk_create(
+        [
+            Utterance(
+                file       = file_obj,
+                speaker    = utt["speaker"],
+                sequence   = utt["sequence"],
+                start_time = utt["start_time"],
+                end_time   = utt["end_time"],
+                content    = utt["content"],
+                sentiment  = utt["sentiment"],
+                profane    = utt["profane"],
+                rate       = file_obj.rate,
+                hop_length = file_obj.hop_length,
+                file_name  = file_obj.name,
+            )
+            for utt in rows
+        ],
+        batch_size=500,
+    )
+
+
+def _store_upload(job: UploadJob) -> None:
+    """
+    업로드 요청 시 기록된 임시 파일을 default_storage에 저장하고 임시 파일을 삭제
+    재시도 시 중복 저장되지 않도록 저장 후 tmp_path를 비웁니다.
+    """
+    if not job.tmp_path:
+        return
+    with open(job.tmp_path, "rb") as f:
+        saved_path = default_storage.save(job.target_name, f)
+    os.unlink(job.tmp_path)
+    job.audio_path = os.path.join(settings.MEDIA_ROOT, saved_path)
+    job.target_name = saved_path
+    job.tmp_path = ""
+    job.save(update_fields=["audio_path", "target_name", "tmp_path"])
+
+
+# 일시적인 장애로 보고 Celery가 자동 재시도하는 예외
+RETRYABLE_ERRORS = (httpx.TransportError, CallyticsServerError, CircuitBreakerError)
+
 
+@shared_task(
+    bind=True,
+    acks_late=True,
+    # 네트워크 오류, 5xx 응답, 차단된 호출은 지수 백오프(2, 4, 8... 최대 60초)로 재시도
+    # 4xx 응답은 요청 자체의 문제이므로 재시도하지 않음
+    autoretry_for=RETRYABLE_ERRORS,
+    retry_backoff=2,
+    retry_backoff_max=60,
+    retry_jitter=True,
+    max_retries=6,
+)
+def run_callytics_pipeline(self, job_id: int) -> int:
+    """
+    UploadJob을 조회해 파이프라인을 실행하고 생성된 File.id를 반환
+    재시도되지 않는 예외(재시도 소진 포함)가 발생하면 작업 상태를 failed로 기록하고 남은 업로드 임시 파일을 삭제합니다.
+    """
+    job = UploadJob.objects.get(pk=job_id)
+    try:
+        return _run_pipeline(job)
+    except Exception as exc:
+        if not (isinstance(exc, RETRYABLE_ERRORS) and self.request.retries < self.max_retries):
+            if job.tmp_path and os.path.exists(job.tmp_path):
+                os.unlink(job.tmp_path)
+            job.tmp_path = ""
+            job.status = UploadJob.STATUS_FAILED
+            job.save(update_fields=["status", "tmp_path"])
+        raise
 
-@shared_task
-def run_callytics_pipeline(audio_path: str, metadata: dict) -> int:
+
+def _run_pipeline(job: UploadJob) -> int:
     """
-    1) Callytics 호출
+    1) 업로드 임시 파일을 스토리지에 저장 후 Callytics 호출 (같은 해시의 File이 있으면 건너뜀)
     2) Topic, File, Utterance 모델에 결과 저장
     3) 생성된 File.id를 반환
     """
+    # 같은 오디오의 분석 결과가 이미 있으면 Callytics 호출 없이 재사용
+    existing_id = File.objects.filter(audio_sha256=job.audio_sha256).values_list("id", flat=True).first()
+    if existing_id is not None:
+        if job.tmp_path:
+            os.unlink(job.tmp_path)
+            job.tmp_path = ""
+        job.status = UploadJob.STATUS_DONE
+        job.file_id = existing_id
+        job.save(update_fields=["status", "file", "tmp_path"])
+        return existing_id
+
+    _store_upload(job)
+    audio_path = job.audio_path
+    metadata = job.metadata
+    job.status = UploadJob.STATUS_PROCESSING
+    job.save(update_fields=["status"])
+
     # API 호출
     result = call_callytics(audio_path, metadata)
 
-    # Topic 객체 생성 또는 조회
+    # 음향 특성 중첩 리스트를 저장 형식(float16) numpy 배열로 한 번에 변환 (형태가 어긋나면 DB 저장 전에 실패)
+    features = {
+        name: np.asarray(result[name], dtype=FEATURE_DTYPE).reshape(-1, dim)
+        for name, dim in FEATURE_DIMS.items()
+    }
+
+    # Topic 객체 생성 또는 조회 (name이 unique라 동시 생성 경합 시 get_or_create가 기존 행을 다시 조회)
     topic_name = metadata.get("topic_name") or result.get("topic")
     topic, _ = Topic.objects.get_or_create(name=topic_name)
 
-    # File 레코드 생성
-    file_obj = File.objects.create(
-        topic       = topic,
-        name        = result["name"],
-        extension   = result["extension"],
-        path        = audio_path,
-        rate        = result["rate"],
-        bit_depth   = result["bit_depth"],
-        channels    = result["channels"],
-        duration    = result["duration"],
-        min_freq    = result["min_freq"],
-        max_freq    = result["max_freq"],
-        rms_loud    = result["rms_loud"],
-        zero_cross  = result["zero_cross"],
-        spec_cent   = result["spec_cent"],
-        spec_bw     = result["spec_bw"],
-        spec_flat   = result["spec_flat"],
-        rolloff     = result["rolloff"],
-        chroma_stft = result["chroma_stft"],
-        spec_contr  = result["spec_contr"],
-        tonnetz     = result["tonnetz"],
-        mfcc        = result["mfcc"],
-        summary     = result.get("summary", ""),
-        conflict    = result["conflict"],
-        silence     = result["silence"],
-    )
+    # File, Utterance 레코드를 하나의 트랜잭션으로 저장
+    try:
+        file_obj = _save_result(job, topic, result, features)
+    except IntegrityError:
+        # 같은 오디오를 동시에 처리하던 다른 작업이 먼저 File을 저장한 경우, 그 결과를 재사용하고
+        # 이 작업이 저장한 오디오 파일은 삭제하고 작업의 경로도 먼저 저장된 File의 오디오로 바꿈
+        winner = File.objects.filter(audio_sha256=job.audio_sha256).values_list("id", "path").first()
+        if winner is None:
+            raise
+        winner_id, winner_path = winner
+        default_storage.delete(job.target_name)
+        job.audio_path = winner_path
+        job.target_name = ""
+        job.status = UploadJob.STATUS_DONE
+        job.file_id = winner_id
+        job.save(update_fields=["audio_path", "target_name", "status", "file"])
+        return winner_id
 
-    # Utterance 레코드 생성
-    for utt in result.get("utterances", []):
-        Utterance.objects.create(
-            file       = file_obj,
-            speaker    = utt["speaker"],
-            sequence   = utt["sequence"],
-            start_time = utt["start_time"],
-            end_time   = utt["end_time"],
-            content    = utt["content"],
-            sentiment  = utt["sentiment"],
-            profane    = utt["profane"],
+    return file_obj.id
+
+
+def _save_result(job: UploadJob, topic: Topic, result: dict, features: dict) -> File:
+    """
+    Callytics 결과로 File, Utterance를 하나의 트랜잭션으로 저장하고 작업을 완료 처리
+    같은 audio_sha256의 File이 이미 있으면 IntegrityError가 발생합니다.
+    """
+    with transaction.atomic():
+        # File 레코드 생성
+        file_obj = File.objects.create(
+            topic       = topic,
+            name        = result["name"],
+            extension   = result["extension"],
+            path        = job.audio_path,
+            rate        = result["rate"],
+            bit_depth   = result["bit_depth"],
+            channels    = result["channels"],
+            duration    = result["duration"],
+            min_freq    = result["min_freq"],
+            max_freq    = result["max_freq"],
+            rms_loud    = result["rms_loud"],
+            zero_cross  = result["zero_cross"],
+            spec_cent   = result["spec_cent"],
+            spec_bw     = result["spec_bw"],
+            spec_flat   = result["spec_flat"],
+            rolloff     = result["rolloff"],
+            chroma_stft_raw = features["chroma_stft"].tobytes(),
+            spec_contr_raw  = features["spec_contr"].tobytes(),
+            tonnetz_raw     = features["tonnetz"].tobytes(),
+            mfcc_raw        = features["mfcc"].tobytes(),
+            summary     = result.get("summary", ""),
+            conflict    = result["conflict"],
+            silence     = result["silence"],
+            audio_sha256 = job.audio_sha256,
+            hop_length  = settings.HOP_LENGTH,
         )
 
-    return file_obj.id
\ No newline at end of file
+        # Utterance 레코드 일괄 생성
+        _insert_utterances(file_obj, result.get("utterances", []))
+
+        job.status = UploadJob.STATUS_DONE
+        job.file = file_obj
+        job.save(update_fields=["status", "file"])
+
+    return file_obj
\ No newline at end of file
@@ -1,3 +1,296 @@
-from django.test import TestCase
+"""
+apps/callytics/tests.py
 
-# Create your tests here.
+run_callytics_pipeline 태스크의 저장/중복 처리 동작과 File 삭제 시 발화 삭제(ON DELETE CASCADE),
+Callytics 클라이언트의 응답 코드별 예외/서킷 브레이커 동작을 검증하는 테스트입니다.
+Callytics API 호출(call_callytics)은 mock 또는 httpx.MockTransport로 대체합니다.
+
+<실행 방법>
+  $ python manage.py test apps.callytics
+"""
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import httpx
+import orjson
+import pybreaker
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from . import clients
+from .clients import CallyticsServerError, call_callytics
+from .models import File, Topic, UploadJob, Utterance
+from .tasks import run_callytics_pipeline
+
+AUDIO_SHA256 = "a" * 64
+CALLYTICS_URL = "http://callytics.test/predict"
+
+
+def make_result(**overrides) -> dict:
+    """
+    Callytics API 응답 형태의 테스트용 결과 딕셔너리
+    """
+    frames = 4
+    result = {
+        "name": "call", "extension": ".wav", "rate": 16000, "bit_depth": 16, "channels": 1,
+        "duration": 1000, "min_freq": 0, "max_freq": 8000, "rms_loud": 0.1,
+        "zero_cross": 1, "spec_cent": 1, "spec_bw": 1, "spec_flat": 1, "rolloff": 1,
+        "chroma_stft": [[0.5] * 12] * frames,
+        "spec_contr":  [[0.5] * 7] * frames,
+        "tonnetz":     [[0.5] * 6] * frames,
+        "mfcc":        [[0.5] * 14] * frames,
+        "summary": "요약", "conflict": False, "silence": 100, "topic": "상품 문의",
+        "utterances": [
+            {"speaker": "agent", "sequence": 1, "start_time": 0, "end_time": 250,
+             "content": "안녕하세요", "sentiment": "neutral", "profane": False},
+            {"speaker": "customer", "sequence": 2, "start_time": 250, "end_time": 500,
+             "content": "문의드립니다", "sentiment": "neutral", "profane": False},
+        ],
+    }
+    result.update(overrides)
+    return result
+
+
+def make_file(audio_sha256: str) -> File:
+    """
+    다른 작업이 먼저 저장한 분석 결과를 흉내 낸 File
+    """
+    topic, _ = Topic.objects.get_or_create(name="상품 문의")
+    return File.objects.create(
+        topic=topic, name="other", extension=".wav", path="/other.wav", rate=16000,
+        bit_depth=16, channels=1, duration=1000, min_freq=0, max_freq=8000, rms_loud=0.1,
+        zero_cross=1, spec_cent=1, spec_bw=1, spec_flat=1, rolloff=1,
+        chroma_stft_raw=b"", spec_contr_raw=b"", tonnetz_raw=b"", mfcc_raw=b"",
+        silence=100, audio_sha256=audio_sha256, hop_length=512,
+    )
+
+
+def mock_callytics_client(test_case, status_code: int, json_body=None) -> list:
+    """
+    clients._CLIENT를 고정 응답을 돌려주는 httpx.MockTransport 클라이언트로 교체하고
+    서킷 브레이커를 닫힌 상태로 초기화. 전송된 요청 목록을 리턴합니다.
+    """
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if json_body is None:
+            return httpx.Response(status_code)
+        return httpx.Response(status_code, content=orjson.dumps(json_body))
+
+    client_patch = mock.patch.object(clients, "_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    client_patch.start()
+    test_case.addCleanup(client_patch.stop)
+    clients._BREAKER.close()
+    test_case.addCleanup(clients._BREAKER.close)
+    return requests
+
+
+class RunCallyticsPipelineTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.upload_tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.upload_tmp, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, UPLOAD_TMP=self.upload_tmp, HOP_LENGTH=512)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def make_job(self) -> UploadJob:
+        fd, tmp_path = tempfile.mkstemp(dir=self.upload_tmp, suffix=".wav")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"RIFF")
+        return UploadJob.objects.create(
+            tmp_path=tmp_path, target_name="uploads/test.wav",
+            user_id=1, gender="male", age=30, audio_sha256=AUDIO_SHA256,
+        )
+
+    @mock.patch("apps.callytics.tasks.call_callytics")
+    def test_saves_file_and_utterances(self, call_callytics):
+        call_callytics.return_value = make_result()
+        job = self.make_job()
+        tmp_path = job.tmp_path
+
+        file_id = run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        file_obj = File.objects.get(pk=file_id)
+        self.assertEqual(job.status, UploadJob.STATUS_DONE)
+        self.assertEqual(job.file_id, file_id)
+        self.assertEqual(file_obj.mfcc.shape, (4, 14))
+        self.assertAlmostEqual(file_obj.duration_seconds, 1000 * 512 / 16000)
+        utterances = list(file_obj.stream_utterances())
+        self.assertEqual([u.sequence for u in utterances], [1, 2])
+        self.assertTrue(default_storage.exists(job.target_name))
+        self.assertFalse(os.path.exists(tmp_path))
+
+    @mock.patch("apps.callytics.tasks.call_callytics")
+    def test_skips_callytics_when_file_already_exists(self, call_callytics):
+        existing = make_file(AUDIO_SHA256)
+        job = self.make_job()
+        tmp_path = job.tmp_path
+
+        file_id = run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        call_callytics.assert_not_called()
+        self.assertEqual(file_id, existing.id)
+        self.assertEqual(job.status, UploadJob.STATUS_DONE)
+        self.assertFalse(os.path.exists(tmp_path))
+
+    @mock.patch("apps.callytics.tasks.call_callytics")
+    def test_reuses_file_saved_by_concurrent_job(self, call_callytics):
+        # 추론 도중 같은 오디오를 처리하던 다른 작업이 File을 먼저 저장한 상황
+        winner = {}
+
+        def finish_other_job_first(audio_path, metadata):
+            winner["file"] = make_file(AUDIO_SHA256)
+            return make_result()
+
+        call_callytics.side_effect = finish_other_job_first
+        job = self.make_job()
+        target_name = job.target_name
+
+        file_id = run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(call_callytics.call_count, 1)
+        self.assertEqual(file_id, winner["file"].id)
+        self.assertEqual(job.status, UploadJob.STATUS_DONE)
+        self.assertEqual(job.file_id, winner["file"].id)
+        self.assertEqual(job.audio_path, winner["file"].path)
+        self.assertEqual(job.target_name, "")
+        self.assertEqual(File.objects.count(), 1)
+        self.assertEqual(Utterance.objects.count(), 0)
+        self.assertFalse(default_storage.exists(target_name))
+
+    @mock.patch("apps.callytics.tasks.call_callytics")
+    def test_marks_job_failed_on_malformed_result(self, call_callytics):
+        call_callytics.return_value = make_result(mfcc=[[0.5] * 13])
+        job = self.make_job()
+
+        with self.assertRaises(ValueError):
+            run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UploadJob.STATUS_FAILED)
+        self.assertFalse(File.objects.exists())
+
+    @mock.patch("apps.callytics.tasks.call_callytics")
+    def test_removes_tmp_file_when_job_fails_before_storing(self, call_callytics):
+        job = self.make_job()
+        tmp_path = job.tmp_path
+
+        with mock.patch("apps.callytics.tasks.default_storage.save", side_effect=PermissionError):
+            with self.assertRaises(PermissionError):
+                run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        call_callytics.assert_not_called()
+        self.assertEqual(job.status, UploadJob.STATUS_FAILED)
+        self.assertEqual(job.tmp_path, "")
+        self.assertFalse(os.path.exists(tmp_path))
+
+    @override_settings(CALLYTICS_URL=CALLYTICS_URL)
+    def test_marks_job_failed_on_client_error(self):
+        mock_callytics_client(self, 400)
+        job = self.make_job()
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UploadJob.STATUS_FAILED)
+
+    @override_settings(CALLYTICS_URL=CALLYTICS_URL)
+    def test_keeps_job_processing_on_retryable_error(self):
+        mock_callytics_client(self, 503)
+        job = self.make_job()
+
+        # 워커 밖에서 직접 호출하면 Celery가 재시도를 예약하지 않고 원래 예외를 다시 발생시킴
+        with self.assertRaises(CallyticsServerError):
+            run_callytics_pipeline(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UploadJob.STATUS_PROCESSING)
+
+
+@override_settings(CALLYTICS_URL=CALLYTICS_URL)
+class CallyticsClientTests(SimpleTestCase):
+    def setUp(self):
+        fd, self.audio_path = tempfile.mkstemp(suffix=".wav")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"RIFF")
+        self.addCleanup(os.unlink, self.audio_path)
+
+    def test_returns_parsed_result(self):
+        requests = mock_callytics_client(self, 200, {"summary": "요약"})
+
+        result = call_callytics(self.audio_path, {"topic_name": "상담"})
+
+        self.assertEqual(result, {"summary": "요약"})
+        self.assertEqual(len(requests), 1)
+
+    def test_raises_server_error_on_5xx(self):
+        mock_callytics_client(self, 502)
+
+        with self.assertRaises(CallyticsServerError) as ctx:
+            call_callytics(self.audio_path, {})
+
+        self.assertEqual(ctx.exception.response.status_code, 502)
+        self.assertEqual(clients._BREAKER.fail_counter, 1)
+
+    def test_client_error_is_not_counted_by_breaker(self):
+        mock_callytics_client(self, 422)
+
+        for _ in range(clients._BREAKER.fail_max + 1):
+            with self.assertRaises(httpx.HTTPStatusError):
+                call_callytics(self.audio_path, {})
+
+        self.assertEqual(clients._BREAKER.fail_counter, 0)
+        self.assertEqual(clients._BREAKER.current_state, pybreaker.STATE_CLOSED)
+
+    def test_open_breaker_blocks_calls(self):
+        requests = mock_callytics_client(self, 500)
+        fail_max = clients._BREAKER.fail_max
+
+        for _ in range(fail_max - 1):
+            with self.assertRaises(CallyticsServerError):
+                call_callytics(self.audio_path, {})
+        # fail_max번째 실패에서 브레이커가 열리고, 이후 호출은 서버로 전송되지 않음
+        with self.assertRaises(pybreaker.CircuitBreakerError):
+            call_callytics(self.audio_path, {})
+        with self.assertRaises(pybreaker.CircuitBreakerError):
+            call_callytics(self.audio_path, {})
+
+        self.assertEqual(clients._BREAKER.current_state, pybreaker.STATE_OPEN)
+        self.assertEqual(len(requests), fail_max)
+
+
+class UtteranceCascadeTests(TestCase):
+    def test_deleting_file_deletes_utterances(self):
+        # Utterance.file은 DO_NOTHING이므로 발화 삭제는 DB의 ON DELETE CASCADE 제약에 달려 있습니다.
+        file_obj = make_file(AUDIO_SHA256)
+        Utterance.objects.create(
+            file=file_obj, speaker="agent", sequence=1, start_time=0, end_time=250,
+            content="안녕하세요", sentiment="neutral", rate=16000, file_name="other", hop_length=512,
+        )
+
+        File.objects.filter(pk=file_obj.pk).delete()
+
+        self.assertFalse(Utterance.objects.exists())
+
+    def test_deleting_topic_deletes_files_and_utterances(self):
+        file_obj = make_file(AUDIO_SHA256)
+        Utterance.objects.create(
+            file=file_obj, speaker="agent", sequence=1, start_time=0, end_time=250,
+            content="안녕하세요", sentiment="neutral", rate=16000, file_name="other", hop_length=512,
+        )
+
+        file_obj.topic.delete()
+
+        self.assertFalse(File.objects.exists())
+        self.assertFalse(Utterance.objects.exists())
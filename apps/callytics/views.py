@@ -8,6 +8,10 @@ Callytics 파이프라인을 트리거하는 API 엔드포인트를 정의합니
 - settings.py에 다음 값을 추가되어 있어야 합니다.
     MEDIA_ROOT = os.getenv("MEDIA_ROOT")  # 업로드된 파일 저장 경로
     MEDIA_URL  = os.getenv("MEDIA_URL")   # 미디어 파일 서빙 URL
+    UPLOAD_TMP = os.getenv("UPLOAD_TMP")  # 업로드 임시 파일 경로 (필수)
+  UPLOAD_TMP는 웹 서버와 Celery 워커(GPU 호스트 포함)가 같은 경로로 마운트한 공유 디렉터리여야 합니다.
+  임시 파일은 권한 0640으로 만들어지므로, 워커 프로세스는 웹 서버와 같은 그룹으로 실행하고
+  (워커가 임시 파일을 삭제하므로) 이 디렉터리에 그룹 쓰기 권한을 주세요.
 
 <사용 예시>
   POST /api/callytics/upload/  
@@ -15,42 +19,69 @@ Callytics 파이프라인을 트리거하는 API 엔드포인트를 정의합니
   Body: { audio: <file>, user_id: 1, gender: "male", age: 30, topic_name: "상품 문의" }
 """
 
+import hashlib
 import os
+import tempfile
 from uuid import uuid4
 from django.conf import settings
-from django.core.files.storage import default_storage
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from .models import File, UploadJob
 from .serializers import FileUploadSerializer
 from .tasks import run_callytics_pipeline
 
+
+# 업로드 임시 파일 권한 (소유자 읽기/쓰기, 그룹 읽기)
+UPLOAD_TMP_MODE = 0o640
+
+
 class FileUploadView(APIView):
     """
     상담 오디오 + 메타데이터를 받아 Callytics 파이프라인을 실행하는 API
     - POST 요청으로 audio, user_id, gender, age, topic_name을 multipart/form-data로 받음
-    - 파일을 MEDIA_ROOT/uploads/UUID.ext 경로에 저장
-    - run_callytics_pipeline 태스크에 파일 경로와 메타데이터 dict 전달
+    - 파일을 UPLOAD_TMP 임시 파일로 쓰면서 SHA-256을 계산
+    - 이미 분석된 파일이면 파이프라인 없이 기존 file_id를 반환
+    - 임시 파일 경로와 메타데이터를 UploadJob에 저장하고, run_callytics_pipeline 태스크에는 job id만 전달
+      (MEDIA_ROOT/uploads/UUID.ext 저장은 태스크에서 수행하여 요청 스레드가 스토리지 쓰기를 기다리지 않음)
     """
     def post(self, request):
         serializer = FileUploadSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # 업로드된 오디오 파일 저장
         audio_file = serializer.validated_data['audio']
         ext = os.path.splitext(audio_file.name)[1]
-        filename = f"uploads/{uuid4().hex}{ext}"
-        saved_path = default_storage.save(filename, audio_file)
-        full_path = os.path.join(settings.MEDIA_ROOT, saved_path)
 
-        # 메타데이터 구성
-        metadata = {
-            'user_id':    serializer.validated_data['user_id'],
-            'gender':     serializer.validated_data['gender'],
-            'age':        serializer.validated_data['age'],
-        }
+        # 업로드된 오디오를 공유 임시 디렉터리에 쓰면서 청크 단위로 해시 계산
+        # (Celery 워커가 읽을 수 있도록 그룹 읽기 권한 부여)
+        if not settings.UPLOAD_TMP:
+            raise ImproperlyConfigured("UPLOAD_TMP must be set to a directory shared with the Celery workers.")
+        sha256 = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(delete=False, dir=settings.UPLOAD_TMP, suffix=ext) as tmp:
+            os.chmod(tmp.name, UPLOAD_TMP_MODE)
+            for chunk in audio_file.chunks():
+                sha256.update(chunk)
+                tmp.write(chunk)
+        digest = sha256.hexdigest()
+
+        # 이미 분석된 오디오라면 기존 결과 반환
+        cached = File.objects.filter(audio_sha256=digest).values_list('id', flat=True).first()
+        if cached is not None:
+            os.unlink(tmp.name)
+            return Response({'status': 'done', 'file_id': cached}, status=status.HTTP_200_OK)
+
+        # 메타데이터와 함께 작업 레코드 생성
+        job = UploadJob.objects.create(
+            tmp_path    = tmp.name,
+            target_name = f"uploads/{uuid4().hex}{ext}",
+            user_id    = serializer.validated_data['user_id'],
+            gender     = serializer.validated_data['gender'],
+            age        = serializer.validated_data['age'],
+            audio_sha256 = digest,
+        )
 
-        # 비동기로 파이프라인 실행
-        run_callytics_pipeline.delay(full_path, metadata)
+        # 비동기로 파이프라인 실행 (브로커에는 job id만 전달)
+        run_callytics_pipeline.delay(job.pk)
 
-        return Response({'status': 'processing'}, status=status.HTTP_202_ACCEPTED)
\ No newline at end of file
+        return Response({'status': 'processing', 'job_id': job.pk}, status=status.HTTP_202_ACCEPTED)
\ No newline at end of file
@@ -1,3 +1,8 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import ScriptMetric
+
+
+@admin.register(ScriptMetric)
+class ScriptMetricAdmin(admin.ModelAdmin):
+    list_display = ("session", "conflict_display", "manual_compliance_ratio")
@@ -0,0 +1,66 @@
+"""
+apps/consultlytics/fields.py
+
+이 파일은 Consultlytics 모델의 JSON 데이터 저장에 사용하는 필드/인코더를 정의합니다.
+- ORJSONEncoder, ORJSONDecoder : 표준 json 모듈 대신 C로 구현된 orjson을 사용하는 JSONField용 인코더/디코더
+- CompressedJSONField          : JSON을 zstd로 압축해 바이너리 컬럼에 저장하는 필드 (크고 반복적인 JSON용)
+
+<사용 예시>
+  from apps.consultlytics.fields import ORJSONEncoder, ORJSONDecoder, CompressedJSONField
+  data = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder)
+  segments = CompressedJSONField()
+"""
+
+import json
+
+import orjson
+import zstandard
+from django.db import models
+
+
+# zstd 압축 레벨 (3: 기본값, 압축률과 속도의 균형)
+ZSTD_LEVEL = 3
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    """
+    orjson으로 직렬화하는 JSONField용 인코더 (numpy 배열도 그대로 직렬화 가능)
+    """
+    def encode(self, o):
+        return orjson.dumps(o, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+class ORJSONDecoder(json.JSONDecoder):
+    """
+    orjson으로 역직렬화하는 JSONField용 디코더
+    """
+    def decode(self, s, _w=None):
+        return orjson.loads(s)
+
+
+class CompressedJSONField(models.BinaryField):
+    """
+    JSON 값을 orjson으로 직렬화한 뒤 zstd로 압축해 바이너리 컬럼에 저장하는 필드
+    - 파이썬 쪽에서는 JSONField처럼 dict/list 값으로 다룹니다.
+    - DB 안에서 JSON 조회(lookup)는 할 수 없으므로, 통째로 읽고 쓰는 큰 데이터에만 사용합니다.
+    """
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return orjson.loads(zstandard.ZstdDecompressor().decompress(bytes(value)))
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(
+            orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        )
+
+    def to_python(self, value):
+        # 직렬화(dumpdata)된 값은 value_to_string이 만든 JSON 문자열이므로 다시 파싱
+        if isinstance(value, str):
+            return orjson.loads(value)
+        return value
+
+    def value_to_string(self, obj):
+        return orjson.dumps(self.value_from_object(obj), option=orjson.OPT_SERIALIZE_NUMPY).decode()
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultlytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='scriptmetric',
+            name='conflict_flag',
+            field=models.BooleanField(default=False, verbose_name='갈등 여부'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-15 10:20
+
+import apps.consultlytics.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultlytics', '0002_alter_scriptmetric_conflict_flag'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='session',
+            name='asr_segments',
+            field=models.JSONField(decoder=apps.consultlytics.fields.ORJSONDecoder, encoder=apps.consultlytics.fields.ORJSONEncoder, help_text='고객/상담사 발화를 분리한 JSON 리스트', verbose_name='ASR 세그먼트'),
+        ),
+        migrations.AlterField(
+            model_name='topnoun',
+            name='nouns',
+            field=models.JSONField(decoder=apps.consultlytics.fields.ORJSONDecoder, encoder=apps.consultlytics.fields.ORJSONEncoder, help_text='추출된 상위 10개 명사 리스트', verbose_name='Top10 명사'),
+        ),
+    ]
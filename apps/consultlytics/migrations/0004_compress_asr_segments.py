@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-15 10:40
+
+import apps.consultlytics.fields
+from django.db import migrations
+
+
+def copy_asr_segments(apps, schema_editor):
+    Session = apps.get_model("consultlytics", "Session")
+    for session in Session.objects.only("session_id", "asr_segments").iterator():
+        session.asr_segments_zst = session.asr_segments
+        session.save(update_fields=["asr_segments_zst"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultlytics', '0003_orjson_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='session',
+            name='asr_segments_zst',
+            field=apps.consultlytics.fields.CompressedJSONField(default=list, help_text='고객/상담사 발화를 분리한 JSON 리스트', verbose_name='ASR 세그먼트'),
+            preserve_default=False,
+        ),
+        # 되돌릴 때 다시 추가되는 JSON 필드는 기본값이 없는 NOT NULL 컬럼이라 데이터를 복원할 수 없으므로 역방향 작업을 두지 않습니다.
+        migrations.RunPython(copy_asr_segments),
+        migrations.RemoveField(
+            model_name='session',
+            name='asr_segments',
+        ),
+        migrations.RenameField(
+            model_name='session',
+            old_name='asr_segments_zst',
+            new_name='asr_segments',
+        ),
+    ]
@@ -18,7 +18,10 @@ apps/consultlytics/models.py
   # 모델 인스턴스를 생성·조회하여 ORM으로 데이터 관리 가능
 """
 
-from django.db import models
+from django.db import models, transaction
+
+from apps.callytics.models import CONFLICT_LABELS
+from .fields import CompressedJSONField, ORJSONDecoder, ORJSONEncoder
 
 
 class Session(models.Model):
@@ -27,17 +30,75 @@ class Session(models.Model):
       - session_id       : 상담 세션 고유 ID
       - speech_count     : 총 발화(turn) 수
       - consulting_text  : 전체 상담 텍스트
-      - asr_segments     : ASR 분할 발화 JSON
+      - asr_segments     : ASR 분할 발화 JSON (zstd 압축 저장)
     """
     session_id      = models.CharField(max_length=100, primary_key=True, verbose_name="세션 ID", help_text="상담 세션 고유 식별자")
     speech_count    = models.IntegerField(verbose_name="총 발화 수", help_text="상담 세션에서 인식된 총 발화 수")
     consulting_text= models.TextField(verbose_name="상담 텍스트", help_text="원본 상담 대화 전체 내용")
-    asr_segments    = models.JSONField(verbose_name="ASR 세그먼트", help_text="고객/상담사 발화를 분리한 JSON 리스트")
+    asr_segments    = CompressedJSONField(verbose_name="ASR 세그먼트", help_text="고객/상담사 발화를 분리한 JSON 리스트")
     created_at      = models.DateTimeField(auto_now_add=True, verbose_name="분석 시각")
 
     def __str__(self):
         return f"Session {self.session_id}"
 
+    @classmethod
+    def with_full_detail(cls):
+        """
+        세션 상세 조회용 QuerySet
+        - OneToOne 관계(category, script_metrics, result)는 select_related로 JOIN
+        - 역방향 FK 목록(top_nouns, emotion_scores)은 prefetch_related로 테이블당 1회 조회
+        """
+        return (
+            cls.objects
+            .select_related("category", "script_metrics", "result")
+            .prefetch_related("top_nouns", "emotion_scores")
+        )
+
+    @classmethod
+    def bulk_ingest(cls, payload: dict) -> "Session":
+        """
+        Consultlytics 분석 결과 전체를 하나의 트랜잭션으로 저장
+        - TopNoun, EmotionScore는 bulk_create로 테이블당 INSERT 1회
+        - 같은 session_id로 다시 저장하면 기존 결과를 덮어씀
+
+        payload 구조
+          {
+            "session_id": ..., "speech_count": ..., "consulting_text": ..., "asr_segments": [...],
+            "nouns_batches": [[...], ...],
+            "emotions": [{"actor": "customer", "star1": ..., ..., "avg_score": ..., "label": ...}, ...],
+            "category": {"mid_category": ..., ...},
+            "script": {"script_phrase_ratio": ..., ...},
+            "label": "만족",
+          }
+        """
+        with transaction.atomic():
+            session, _ = cls.objects.update_or_create(
+                session_id=payload["session_id"],
+                defaults={
+                    "speech_count":    payload["speech_count"],
+                    "consulting_text": payload["consulting_text"],
+                    "asr_segments":    payload["asr_segments"],
+                },
+            )
+
+            session.top_nouns.all().delete()
+            TopNoun.objects.bulk_create([
+                TopNoun(session=session, nouns=nouns)
+                for nouns in payload.get("nouns_batches", [])
+            ])
+
+            session.emotion_scores.all().delete()
+            EmotionScore.objects.bulk_create([
+                EmotionScore(session=session, **emotion)
+                for emotion in payload.get("emotions", [])
+            ])
+
+            Category.objects.update_or_create(session=session, defaults=payload["category"])
+            ScriptMetric.objects.update_or_create(session=session, defaults=payload["script"])
+            ResultClassification.objects.update_or_create(session=session, defaults={"label": payload["label"]})
+
+        return session
+
 
 class TopNoun(models.Model):
     """
@@ -46,7 +107,7 @@ class TopNoun(models.Model):
       - nouns   : 명사 리스트(JSON)
     """
     session = models.ForeignKey(Session, on_delete=models.CASCADE, verbose_name="세션", related_name="top_nouns")
-    nouns   = models.JSONField(verbose_name="Top10 명사", help_text="추출된 상위 10개 명사 리스트")
+    nouns   = models.JSONField(encoder=ORJSONEncoder, decoder=ORJSONDecoder, verbose_name="Top10 명사", help_text="추출된 상위 10개 명사 리스트")
 
     def __str__(self):
         return f"Top Nouns for {self.session.session_id}"
@@ -127,12 +188,19 @@ class ScriptMetric(models.Model):
     apology_ratio         = models.FloatField(verbose_name="사과 멘트 비율")
     request_ratio         = models.FloatField(verbose_name="의뢰 멘트 비율")
     alternative_count     = models.IntegerField(verbose_name="대안 제안 횟수")
-    conflict_flag         = models.BooleanField(default=False, verbose_name="갈등 여부", choices=[(False, "없음"),(True, "있음")])
+    conflict_flag         = models.BooleanField(default=False, verbose_name="갈등 여부")
     manual_compliance_ratio = models.FloatField(verbose_name="매뉴얼 준수 비율")
 
     def __str__(self):
         return f"ScriptMetric @ {self.session.session_id}"
 
+    def conflict_display(self) -> str:
+        """
+        갈등 여부 표시 라벨('없음'/'있음')
+        """
+        return CONFLICT_LABELS[self.conflict_flag]
+    conflict_display.short_description = "갈등 여부"
+
 
 class ResultClassification(models.Model):
     """
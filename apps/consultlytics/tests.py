@@ -1,3 +1,87 @@
+"""
+apps/consultlytics/tests.py
+
+Consultlytics 모델 필드의 저장/직렬화 동작과 세션 일괄 저장/상세 조회를 검증하는 테스트입니다.
+
+<실행 방법>
+  $ python manage.py test apps.consultlytics
+"""
+
+from django.core import serializers
 from django.test import TestCase
 
-# Create your tests here.
+from .models import EmotionScore, Session, TopNoun
+
+SEGMENTS = [
+    {"speaker": "customer", "text": "요금제 변경하고 싶어요"},
+    {"speaker": "agent", "text": "네, 도와드리겠습니다"},
+]
+
+
+def make_payload(label: str = "만족", avg_score: float = 4.0) -> dict:
+    """
+    Session.bulk_ingest에 전달하는 분석 결과 형태의 테스트용 딕셔너리
+    """
+    emotion = {"star1": 0.1, "star2": 0.1, "star3": 0.2, "star4": 0.3, "star5": 0.3, "avg_score": avg_score, "label": "긍정"}
+    return {
+        "session_id": "s1", "speech_count": 2, "consulting_text": "상담 내용", "asr_segments": SEGMENTS,
+        "nouns_batches": [["요금제", "변경"]],
+        "emotions": [{"actor": "customer", **emotion}, {"actor": "agent", **emotion}],
+        "category": {
+            "mid_category": "요금", "content_category": "변경", "mid_category_id": 1,
+            "result_label": label, "label_id": 0,
+        },
+        "script": {
+            "script_phrase_ratio": 0.9, "honorific_ratio": 0.9, "positive_word_ratio": 0.5,
+            "euphonious_word_ratio": 0.1, "confirmation_ratio": 0.2, "empathy_ratio": 0.3,
+            "apology_ratio": 0.0, "request_ratio": 0.1, "alternative_count": 1,
+            "conflict_flag": False, "manual_compliance_ratio": 0.8,
+        },
+        "label": label,
+    }
+
+
+class CompressedJSONFieldTests(TestCase):
+    def setUp(self):
+        Session.objects.create(
+            session_id="s1", speech_count=2, consulting_text="상담 내용", asr_segments=SEGMENTS,
+        )
+
+    def test_reload_returns_original_value(self):
+        self.assertEqual(Session.objects.get(pk="s1").asr_segments, SEGMENTS)
+
+    def test_dump_and_load_round_trip(self):
+        data = serializers.serialize("json", Session.objects.all())
+        Session.objects.all().delete()
+
+        for obj in serializers.deserialize("json", data):
+            self.assertEqual(obj.object.asr_segments, SEGMENTS)
+            obj.save()
+
+        self.assertEqual(Session.objects.get(pk="s1").asr_segments, SEGMENTS)
+
+
+class SessionIngestTests(TestCase):
+    def test_ingest_twice_replaces_previous_result(self):
+        Session.bulk_ingest(make_payload())
+        Session.bulk_ingest(make_payload(label="미흡", avg_score=2.0))
+
+        self.assertEqual(Session.objects.count(), 1)
+        self.assertEqual(TopNoun.objects.count(), 1)
+        self.assertEqual(
+            sorted(EmotionScore.objects.values_list("actor", "avg_score")),
+            [("agent", 2.0), ("customer", 2.0)],
+        )
+        self.assertEqual(Session.objects.get(pk="s1").result.label, "미흡")
+
+    def test_full_detail_loads_related_rows_without_extra_queries(self):
+        Session.bulk_ingest(make_payload())
+
+        # 세션 + OneToOne JOIN 1회, top_nouns/emotion_scores prefetch 각 1회
+        with self.assertNumQueries(3):
+            session = Session.with_full_detail().get(pk="s1")
+            self.assertEqual(session.category.mid_category, "요금")
+            self.assertFalse(session.script_metrics.conflict_flag)
+            self.assertEqual(session.result.label, "만족")
+            self.assertEqual([n.nouns for n in session.top_nouns.all()], [["요금제", "변경"]])
+            self.assertEqual(len(session.emotion_scores.all()), 2)
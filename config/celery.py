@@ -0,0 +1,40 @@
+"""
+config/celery.py
+
+이 파일은 Django 프로젝트용 Celery 앱을 생성하고, 작업 성격에 따라 큐를 분리합니다.
+
+<큐 구성>
+- callytics_gpu      : GPU 추론 서버를 호출하는 Callytics 파이프라인 태스크
+- consultlytics_cpu  : DB/CPU 위주의 Consultlytics 태스크
+  GPU 태스크가 가벼운 태스크의 처리를 막지 않도록 큐별로 워커 풀을 따로 띄웁니다.
+
+<워커 실행 예시>
+  # GPU 호스트
+  $ celery -A config worker -Q callytics_gpu --concurrency=2
+  # 그 외 호스트
+  $ celery -A config worker -Q consultlytics_cpu --concurrency=8
+"""
+
+import os
+
+from celery import Celery
+from kombu import Queue
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('config')
+
+# settings.py의 CELERY_ 로 시작하는 설정을 읽어옵니다.
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+app.conf.task_queues = (
+    Queue('callytics_gpu'),
+    Queue('consultlytics_cpu'),
+)
+app.conf.task_default_queue = 'consultlytics_cpu'
+app.conf.task_routes = {
+    'apps.callytics.tasks.*':     {'queue': 'callytics_gpu'},
+    'apps.consultlytics.tasks.*': {'queue': 'consultlytics_cpu'},
+}
+
+app.autodiscover_tasks()
@@ -127,6 +127,7 @@ STATIC_URL = 'static/'
 
 MEDIA_ROOT = os.getenv("MEDIA_ROOT")  # 업로드된 파일 저장 경로
 MEDIA_URL  = os.getenv("MEDIA_URL")   # 미디어 파일 서빙 URL
+UPLOAD_TMP = os.getenv("UPLOAD_TMP")  # 업로드 임시 파일 경로 (필수, 웹 서버와 Celery 워커가 공유하는 마운트)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field